@@ -30,6 +30,9 @@ CREATE TABLE model_info (
 CREATE INDEX IX_model_info_name ON model_info(name);
 CREATE INDEX IX_model_info_model_type ON model_info(model_type);
 CREATE INDEX IX_model_info_is_active ON model_info(is_active);
+-- Composite index matching ix_modelinfo_type_active in src/db/models.py:
+-- covers the "active models of a type" lookup with a single seek
+CREATE INDEX ix_modelinfo_type_active ON model_info(model_type, is_active);
 
 -- Insert sample data
 INSERT INTO model_info (name, version, model_type, description, is_active)
@@ -50,9 +53,14 @@ CREATE TABLE Worker (
 );
 
 -- Create indexes for better performance
-CREATE INDEX IX_Worker_Department ON Worker(DEPARTMENT);
+-- DEPARTMENT index covers the department filter/distinct queries in the
+-- workers API (WORKER_ID included explicitly for covering seeks)
+CREATE INDEX IX_Worker_Department ON Worker(DEPARTMENT) INCLUDE (WORKER_ID);
 CREATE INDEX IX_Worker_Salary ON Worker(SALARY);
 CREATE INDEX IX_Worker_JoiningDate ON Worker(JOINING_DATE);
+-- Composite index matching ix_worker_dept_salary in src/db/models.py:
+-- serves department-filtered salary queries and aggregates from the index
+CREATE INDEX ix_worker_dept_salary ON Worker(DEPARTMENT, SALARY);
 
 PRINT 'Worker table created successfully.';
 GO
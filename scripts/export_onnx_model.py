@@ -0,0 +1,59 @@
+"""
+Offline export of the fraud detection model to quantized ONNX.
+
+Fuses the StandardScaler and LogisticRegression pickles from models/ into a
+single ONNX graph, then quantizes the weights to int8 for fast CPU inference.
+The API (src/api/routers/ml.py) picks up models/fraud_pipeline.int8.onnx
+automatically when onnxruntime is installed and falls back to the pickles
+otherwise.
+
+Usage (from the repository root):
+    python scripts/export_onnx_model.py
+"""
+import os
+
+import joblib
+from sklearn.pipeline import Pipeline
+from skl2onnx import convert_sklearn
+from skl2onnx.common.data_types import FloatTensorType
+from onnxruntime.quantization import quantize_dynamic
+
+MODELS_DIR = "models"
+ONNX_PATH = os.path.join(MODELS_DIR, "fraud_pipeline.onnx")
+ONNX_INT8_PATH = os.path.join(MODELS_DIR, "fraud_pipeline.int8.onnx")
+
+
+def main():
+    model = joblib.load(os.path.join(MODELS_DIR, "fraud_model.pkl"))
+    scaler = joblib.load(os.path.join(MODELS_DIR, "scaler.pkl"))
+    model_columns = joblib.load(os.path.join(MODELS_DIR, "model_columns.pkl"))
+
+    # Fuse scaler + model into one graph so inference is a single call on
+    # raw (unscaled) features
+    pipeline = Pipeline([("scaler", scaler), ("model", model)])
+    onnx_model = convert_sklearn(
+        pipeline,
+        initial_types=[("X", FloatTensorType([None, len(model_columns)]))],
+        options={id(model): {"zipmap": False}},  # probabilities as a plain tensor
+    )
+
+    # convert_sklearn can emit a duplicate default-domain opset entry, which
+    # the onnxruntime quantizer rejects - keep each (domain, version) once
+    seen = set()
+    unique_opsets = [
+        o for o in onnx_model.opset_import
+        if (o.domain, o.version) not in seen and not seen.add((o.domain, o.version))
+    ]
+    del onnx_model.opset_import[:]
+    onnx_model.opset_import.extend(unique_opsets)
+
+    with open(ONNX_PATH, "wb") as f:
+        f.write(onnx_model.SerializeToString())
+    print(f"Exported {ONNX_PATH}")
+
+    quantize_dynamic(ONNX_PATH, ONNX_INT8_PATH)
+    print(f"Quantized to {ONNX_INT8_PATH}")
+
+
+if __name__ == "__main__":
+    main()
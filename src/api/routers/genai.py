@@ -6,11 +6,14 @@ from fastapi import APIRouter
 
 router = APIRouter()
 
+# Static payload built once at import - no per-request dict construction
+_GENAI_MODELS_PAYLOAD = {"models": [], "message": "GenAI endpoints ready for implementation"}
+
 
 @router.get("/models")
 async def list_genai_models() -> Dict[str, Any]:
     """List available GenAI models."""
-    return {"models": [], "message": "GenAI endpoints ready for implementation"}
+    return _GENAI_MODELS_PAYLOAD
 
 
 @router.post("/chat")
@@ -1,9 +1,12 @@
 """
 Health check endpoints.
 """
+import os
+import time
 from datetime import datetime
-from typing import Dict, Any
+from typing import Dict, Any, Tuple
 from fastapi import APIRouter, Depends
+from fastapi.responses import ORJSONResponse
 from sqlalchemy import text
 from sqlalchemy.orm import Session
 
@@ -12,111 +15,149 @@ from src.db.database import get_db
 
 router = APIRouter()
 
+# Probe statement parsed once instead of per request
+_PING_STMT = text("SELECT 1")
 
-@router.get("/health")
-async def health_check() -> Dict[str, Any]:
-    """
-    Basic health check endpoint.
-    Returns application status and basic information.
-    """
-    return {
-        "status": "healthy",
-        "timestamp": datetime.utcnow().isoformat(),
-        "version": settings.VERSION,
-        "environment": settings.ENVIRONMENT,
-        "app_name": settings.APP_NAME
-    }
+# Cache the database probe result briefly so liveness-probe storms
+# (e.g. K8s hitting /health/detailed at 1Hz+) don't each hit the DB
+_DB_PROBE_TTL_SECONDS = 1.0
+_db_probe_cache: Dict[str, Any] = {"expires": 0.0, "component": None, "healthy": True}
 
+# Static payload skeletons built once at import; handlers only splice in the
+# timestamp so probe endpoints don't rebuild the same dict on every hit
+_HEALTH_BASE = {
+    "status": "healthy",
+    "version": settings.VERSION,
+    "environment": settings.ENVIRONMENT,
+    "app_name": settings.APP_NAME
+}
+_READY_BASE = {"status": "ready"}
+_LIVE_BASE = {"status": "alive"}
 
-@router.get("/health/detailed")
-async def detailed_health_check(db: Session = Depends(get_db)) -> Dict[str, Any]:
-    """
-    Detailed health check including database connectivity.
-    """
-    health_status = {
-        "status": "healthy",
-        "timestamp": datetime.utcnow().isoformat(),
-        "version": settings.VERSION,
-        "environment": settings.ENVIRONMENT,
-        "app_name": settings.APP_NAME,
-        "components": {}
-    }
-    
-    # Check database connectivity
-    try:
-        result = db.execute(text("SELECT 1")).fetchone()
-        health_status["components"]["database"] = {
-            "status": "healthy" if result else "unhealthy",
-            "details": "SQL Server connection successful",
-            "connection_info": {
-                "host": settings.SQL_SERVER_HOST,
-                "port": settings.SQL_SERVER_PORT,
-                "database": settings.SQL_SERVER_DATABASE,
-                "driver": settings.SQL_SERVER_DRIVER
-            }
-        }
-    except Exception as e:
-        health_status["status"] = "degraded"
-        health_status["components"]["database"] = {
-            "status": "unhealthy",
-            "details": f"Database connection failed: {str(e)}",
-            "connection_info": {
-                "host": settings.SQL_SERVER_HOST,
-                "port": settings.SQL_SERVER_PORT,
-                "database": settings.SQL_SERVER_DATABASE,
-                "driver": settings.SQL_SERVER_DRIVER
-            }
-        }
-        
-    # Check available ODBC drivers
+
+def _scan_odbc_drivers() -> Dict[str, Any]:
+    """Scan installed ODBC drivers - the list is fixed for the process lifetime."""
     try:
-        import pyodbc
-        available_drivers = pyodbc.drivers()
-        health_status["components"]["odbc_drivers"] = {
+        import pyodbc  # deferred: driver-manager issues shouldn't break import
+        return {
             "status": "healthy",
-            "available_drivers": available_drivers
+            "available_drivers": pyodbc.drivers()
         }
     except Exception as e:
-        health_status["components"]["odbc_drivers"] = {
+        return {
             "status": "warning",
             "details": f"Could not list ODBC drivers: {str(e)}"
         }
-    
-    # Check ML models directory
-    import os
+
+
+def _scan_ml_models_dir() -> Dict[str, Any]:
+    """Scan the ML models directory once instead of per health-check request."""
     ml_model_path = settings.ML_MODEL_PATH
     if os.path.exists(ml_model_path):
         model_count = len([f for f in os.listdir(ml_model_path) if os.path.isfile(os.path.join(ml_model_path, f))])
-        health_status["components"]["ml_models"] = {
+        return {
             "status": "healthy",
             "details": f"Models directory exists with {model_count} files"
         }
-    else:
-        health_status["components"]["ml_models"] = {
-            "status": "warning",
-            "details": "Models directory does not exist"
+    return {
+        "status": "warning",
+        "details": "Models directory does not exist"
+    }
+
+
+# Scanned once at import - both involve syscalls that don't change while
+# the process is running
+_ODBC_DRIVERS_COMPONENT = _scan_odbc_drivers()
+_ML_MODELS_COMPONENT = _scan_ml_models_dir()
+
+
+def _probe_database(db: Session) -> Tuple[Dict[str, Any], bool]:
+    """
+    Run the database connectivity probe, reusing a recent result when available.
+    Returns the database component dict and whether the probe was healthy.
+    """
+    now = time.monotonic()
+    if _db_probe_cache["component"] is not None and now < _db_probe_cache["expires"]:
+        return _db_probe_cache["component"], _db_probe_cache["healthy"]
+
+    connection_info = {
+        "host": settings.SQL_SERVER_HOST,
+        "port": settings.SQL_SERVER_PORT,
+        "database": settings.SQL_SERVER_DATABASE,
+        "driver": settings.SQL_SERVER_DRIVER
+    }
+
+    try:
+        result = db.execute(_PING_STMT).fetchone()
+        healthy = result is not None
+        component = {
+            "status": "healthy" if healthy else "unhealthy",
+            "details": "SQL Server connection successful",
+            "connection_info": connection_info
         }
+    except Exception as e:
+        healthy = False
+        component = {
+            "status": "unhealthy",
+            "details": f"Database connection failed: {str(e)}",
+            "connection_info": connection_info
+        }
+
+    _db_probe_cache["expires"] = now + _DB_PROBE_TTL_SECONDS
+    _db_probe_cache["component"] = component
+    _db_probe_cache["healthy"] = healthy
+    return component, healthy
+
+
+# Probe handlers return ORJSONResponse directly: this skips FastAPI's
+# Python-level jsonable_encoder pass and lets orjson's C encoder render
+# the datetime as ISO 8601, instead of calling .isoformat() per request.
+
+@router.get("/health")
+async def health_check() -> ORJSONResponse:
+    """
+    Basic health check endpoint.
+    Returns application status and basic information.
+    """
+    return ORJSONResponse({**_HEALTH_BASE, "timestamp": datetime.utcnow()})
+
+
+@router.get("/health/detailed")
+def detailed_health_check(db: Session = Depends(get_db)) -> ORJSONResponse:
+    """
+    Detailed health check including database connectivity.
+    """
+    health_status = {
+        **_HEALTH_BASE,
+        "timestamp": datetime.utcnow(),
+        "components": {}
+    }
     
-    return health_status
+    # Check database connectivity (cached for _DB_PROBE_TTL_SECONDS)
+    db_component, db_healthy = _probe_database(db)
+    health_status["components"]["database"] = db_component
+    if not db_healthy:
+        health_status["status"] = "degraded"
+
+    # ODBC drivers and model directory don't change during the process
+    # lifetime - use the components scanned once at import
+    health_status["components"]["odbc_drivers"] = _ODBC_DRIVERS_COMPONENT
+    health_status["components"]["ml_models"] = _ML_MODELS_COMPONENT
+
+    return ORJSONResponse(health_status)
 
 
 @router.get("/health/ready")
-async def readiness_check() -> Dict[str, str]:
+async def readiness_check() -> ORJSONResponse:
     """
     Readiness check for Kubernetes/container orchestration.
     """
-    return {
-        "status": "ready",
-        "timestamp": datetime.utcnow().isoformat()
-    }
+    return ORJSONResponse({**_READY_BASE, "timestamp": datetime.utcnow()})
 
 
 @router.get("/health/live")
-async def liveness_check() -> Dict[str, str]:
+async def liveness_check() -> ORJSONResponse:
     """
     Liveness check for Kubernetes/container orchestration.
     """
-    return {
-        "status": "alive",
-        "timestamp": datetime.utcnow().isoformat()
-    }
\ No newline at end of file
+    return ORJSONResponse({**_LIVE_BASE, "timestamp": datetime.utcnow()})
\ No newline at end of file
@@ -1,13 +1,22 @@
 """
 Machine Learning model endpoints.
 """
+import asyncio
 import os
-from typing import Dict, Any
+from collections import OrderedDict
+from typing import Dict, Any, Optional, Tuple
 from fastapi import APIRouter, HTTPException, status
 from pydantic import BaseModel
-import pandas as pd
+import numpy as np
 import joblib
 
+# onnxruntime is optional - when available (and the exported graph exists)
+# inference runs through the quantized ONNX pipeline instead of the pickles
+try:
+    import onnxruntime as ort
+except ImportError:
+    ort = None
+
 from src.core.config import settings
 
 router = APIRouter()
@@ -18,32 +27,66 @@ router = APIRouter()
 model = None
 scaler = None
 model_columns = None
+onnx_session = None
 
 def load_fraud_models():
     """Load fraud detection models from disk."""
-    global model, scaler, model_columns
-    
+    global model, scaler, model_columns, onnx_session
+
     models_dir = "models"
-    
+
     try:
         model_path = os.path.join(models_dir, "fraud_model.pkl")
         scaler_path = os.path.join(models_dir, "scaler.pkl")
         columns_path = os.path.join(models_dir, "model_columns.pkl")
         
         if os.path.exists(model_path) and os.path.exists(scaler_path) and os.path.exists(columns_path):
-            model = joblib.load(model_path)
-            scaler = joblib.load(scaler_path)
+            # mmap_mode='r' memory-maps the model arrays so multiple worker
+            # processes share one physical copy via the page cache
+            model = joblib.load(model_path, mmap_mode='r')
+            scaler = joblib.load(scaler_path, mmap_mode='r')
             model_columns = joblib.load(columns_path)
+
+            # Inference parallelism comes from server workers, not from the
+            # estimator - a training-time n_jobs > 1 would oversubscribe CPU
+            if hasattr(model, "n_jobs"):
+                model.n_jobs = 1
+
+            # Validate once at load time that the Transaction schema covers
+            # every training column, instead of re-checking on every request
+            missing_cols = [col for col in model_columns if col not in Transaction.model_fields]
+            if missing_cols:
+                model = scaler = model_columns = None
+                raise ValueError(f"Transaction schema is missing required model columns: {missing_cols}")
+
+            # Prefer the int8-quantized ONNX pipeline (scaler + model fused
+            # into one graph, exported by scripts/export_onnx_model.py) for
+            # CPU inference when onnxruntime is installed
+            onnx_session = None
+            onnx_path = os.path.join(models_dir, "fraud_pipeline.int8.onnx")
+            if ort is not None and os.path.exists(onnx_path):
+                try:
+                    sess_options = ort.SessionOptions()
+                    sess_options.intra_op_num_threads = os.cpu_count() or 1
+                    onnx_session = ort.InferenceSession(
+                        onnx_path,
+                        sess_options=sess_options,
+                        providers=["CPUExecutionProvider"]
+                    )
+                    print("✅ Quantized ONNX fraud pipeline loaded for inference")
+                except Exception as e:
+                    onnx_session = None
+                    print(f"⚠️  Could not load ONNX pipeline, falling back to pickles: {e}")
+
+            # Cached predictions belong to the previous model artifacts
+            _prediction_cache.clear()
+
             print("✅ Fraud detection models loaded successfully")
         else:
             print("⚠️  Model files not found. Please ensure fraud_model.pkl, scaler.pkl, and model_columns.pkl are in the models/ directory")
     except Exception as e:
         print(f"❌ Error loading models: {e}")
 
-# Load models when module is imported
-load_fraud_models()
-
-
 # ---------------------------------------------------
 # Request schema (input)
 # ---------------------------------------------------
@@ -91,6 +134,132 @@ class BatchPredictionResponse(BaseModel):
     errors: list[dict] = []
 
 
+def _predict_proba_batch(features: np.ndarray) -> np.ndarray:
+    """
+    Return fraud probabilities for raw (unscaled) float32 feature rows.
+
+    Uses the fused int8 ONNX pipeline when loaded (scaling happens inside
+    the graph), otherwise the StandardScaler + sklearn model pickles.
+    """
+    if onnx_session is not None:
+        # Outputs are [label, probabilities]; take the fraud (class 1) column
+        return onnx_session.run(None, {"X": features})[1][:, 1]
+    return model.predict_proba(scaler.transform(features))[:, 1]
+
+
+# Prediction cache: predictions are deterministic given the features, so
+# repeated scoring of the same transaction is a dict lookup. Cleared
+# whenever models are (re)loaded.
+_PREDICTION_CACHE_MAXSIZE = 100_000
+_prediction_cache: "OrderedDict[Tuple[float, ...], Tuple[int, float]]" = OrderedDict()
+
+
+def _cache_put(features: Tuple[float, ...], result: Tuple[int, float]) -> None:
+    """Store a prediction, evicting the least recently used entry when full."""
+    _prediction_cache[features] = result
+    if len(_prediction_cache) > _PREDICTION_CACHE_MAXSIZE:
+        _prediction_cache.popitem(last=False)
+
+
+def _cache_get(features: Tuple[float, ...]) -> Optional[Tuple[int, float]]:
+    """Look up a cached prediction, promoting the entry to most recent.
+
+    The promotion is what makes eviction LRU rather than FIFO: without it,
+    popitem(last=False) would drop the oldest-inserted entries even while
+    they are the hottest keys.
+    """
+    cached = _prediction_cache.get(features)
+    if cached is not None:
+        _prediction_cache.move_to_end(features)
+    return cached
+
+
+def _predict_cached(features: Tuple[float, ...]) -> Tuple[int, float]:
+    """
+    Run the scaler + model on a feature tuple in training column order,
+    reusing a cached result when available.
+    """
+    cached = _cache_get(features)
+    if cached is not None:
+        return cached
+
+    # Build a single contiguous feature row. Skipping the per-request
+    # DataFrame keeps this path free of pandas construction overhead.
+    x = np.fromiter(features, dtype=np.float32, count=len(features)).reshape(1, -1)
+
+    # A single probability gives both the score and (via the 0.5 decision
+    # threshold) the class label
+    prob = float(_predict_proba_batch(x)[0])  # Probability of fraud (class 1)
+    result = (int(prob >= 0.5), prob)
+    _cache_put(features, result)
+    return result
+
+
+# ---------------------------------------------------
+# Dynamic batching for /predict/transaction
+# ---------------------------------------------------
+# Concurrent single-transaction requests are coalesced into one model call:
+# each request parks a future on the queue and the batcher task drains the
+# queue (up to _BATCH_MAX_SIZE items, waiting at most _BATCH_MAX_WAIT_MS for
+# stragglers) before running _predict_proba_batch once for the whole group.
+_BATCH_MAX_SIZE = 64
+_BATCH_MAX_WAIT_MS = 5.0
+_batch_queue: Optional["asyncio.Queue"] = None
+_batcher_task: Optional["asyncio.Task"] = None
+
+
+async def _prediction_batcher() -> None:
+    """Drain the prediction queue, scoring each group with one model call."""
+    loop = asyncio.get_running_loop()
+    while True:
+        pending = [await _batch_queue.get()]
+        deadline = loop.time() + _BATCH_MAX_WAIT_MS / 1000.0
+        while len(pending) < _BATCH_MAX_SIZE:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            try:
+                pending.append(await asyncio.wait_for(_batch_queue.get(), timeout=remaining))
+            except asyncio.TimeoutError:
+                break
+
+        try:
+            features = np.array([key for key, _ in pending], dtype=np.float32)
+            probs = _predict_proba_batch(features)
+        except Exception as e:
+            for _, fut in pending:
+                if not fut.done():
+                    fut.set_exception(e)
+            continue
+
+        for (key, fut), prob in zip(pending, probs):
+            prob = float(prob)
+            result = (int(prob >= 0.5), prob)
+            _cache_put(key, result)
+            if not fut.done():
+                fut.set_result(result)
+
+
+def start_prediction_batcher() -> None:
+    """Start the dynamic-batching task - called from the app lifespan."""
+    global _batch_queue, _batcher_task
+    _batch_queue = asyncio.Queue()
+    _batcher_task = asyncio.get_running_loop().create_task(_prediction_batcher())
+
+
+async def stop_prediction_batcher() -> None:
+    """Stop the dynamic-batching task - called from the app lifespan."""
+    global _batch_queue, _batcher_task
+    if _batcher_task is not None:
+        _batcher_task.cancel()
+        try:
+            await _batcher_task
+        except asyncio.CancelledError:
+            pass
+    _batch_queue = None
+    _batcher_task = None
+
+
 # ---------------------------------------------------
 # Risk rule function
 # ---------------------------------------------------
@@ -115,65 +284,61 @@ def risk_category(prob: float) -> str:
 # Endpoints
 # ---------------------------------------------------
 
+# Static file info for /models - only the "loaded" flag is dynamic
+_FRAUD_MODEL_FILES = {
+    "model_file": "fraud_model.pkl",
+    "scaler_file": "scaler.pkl",
+    "columns_file": "model_columns.pkl"
+}
+
+
 @router.get("/models")
 async def list_models() -> Dict[str, Any]:
     """List available ML models and their status."""
     models_status = {
         "fraud_detection": {
             "loaded": model is not None and scaler is not None and model_columns is not None,
-            "model_file": "fraud_model.pkl",
-            "scaler_file": "scaler.pkl", 
-            "columns_file": "model_columns.pkl"
+            **_FRAUD_MODEL_FILES
         }
     }
-    
+
     return {
         "models": models_status,
         "message": "ML models status"
     }
 
 
-def _predict_single_transaction(txn: Transaction) -> FraudPredictionResponse:
+async def _predict_single_transaction(txn: Transaction) -> FraudPredictionResponse:
     """
     Internal helper function to predict fraud for a single transaction.
-    
+
+    Cache hits are answered immediately; misses are handed to the dynamic
+    batcher so concurrent requests share one model call (falling back to an
+    inline prediction when the batcher isn't running).
+
     Args:
         txn: Transaction data
-        
+
     Returns:
         Fraud prediction response
-        
+
     Raises:
         Exception: If prediction fails
     """
-    # Convert to dataframe
-    df = pd.DataFrame([txn.dict()])
-    
-    # Keep IDs for response
-    txn_id = df["transaction_id"].iloc[0]
-    cust_id = df["customer_id"].iloc[0]
-    
-    # Keep all columns including IDs as they were part of training data
-    df_model = df.copy()
-    
-    # Verify all required columns are present
-    missing_cols = [col for col in model_columns if col not in df_model.columns]
-    if missing_cols:
-        raise ValueError(f"Missing required columns: {missing_cols}")
-    
-    # Ensure feature order matches training data exactly
-    df_model = df_model[model_columns]
-    
-    # Scale features
-    scaled = scaler.transform(df_model)
-    
-    # Make predictions
-    pred = int(model.predict(scaled)[0])
-    prob = float(model.predict_proba(scaled)[0][1])  # Probability of fraud (class 1)
-    
+    features_key = tuple(getattr(txn, col) for col in model_columns)
+    result = _cache_get(features_key)
+    if result is None:
+        if _batch_queue is not None:
+            future = asyncio.get_running_loop().create_future()
+            await _batch_queue.put((features_key, future))
+            result = await future
+        else:
+            result = _predict_cached(features_key)
+    pred, prob = result
+
     return FraudPredictionResponse(
-        transaction_id=txn_id,
-        customer_id=cust_id,
+        transaction_id=txn.transaction_id,
+        customer_id=txn.customer_id,
         fraud_prediction=pred,
         fraud_probability=round(prob, 4),
         risk_level=risk_category(prob)
@@ -202,7 +367,7 @@ async def predict_fraud(txn: Transaction) -> FraudPredictionResponse:
         )
     
     try:
-        return _predict_single_transaction(txn)
+        return await _predict_single_transaction(txn)
         
     except Exception as e:
         raise HTTPException(
@@ -239,18 +404,47 @@ async def predict_fraud_batch(batch_request: BatchTransactionRequest) -> BatchPr
             detail="No transactions provided for batch processing."
         )
     
+    transactions = batch_request.transactions
+
+    # Vectorized path: build one feature matrix for the whole batch and run
+    # the scaler/model exactly once instead of per transaction. Reading
+    # attributes directly avoids a per-transaction .dict() allocation and
+    # the pandas DataFrame round trip entirely.
+    try:
+        features = np.array(
+            [[getattr(txn, col) for col in model_columns] for txn in transactions],
+            dtype=np.float32
+        )
+        probs = _predict_proba_batch(features)
+        preds = (probs >= 0.5).astype(int)
+        levels = np.select(
+            [probs >= settings.FRAUD_RISK_HIGH_THRESHOLD, probs >= settings.FRAUD_RISK_LOW_THRESHOLD],
+            [settings.FRAUD_RISK_HIGH_LABEL, settings.FRAUD_RISK_MODERATE_LABEL],
+            default=settings.FRAUD_RISK_NORMAL_LABEL
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error making batch prediction: {str(e)}"
+        )
+
     results = []
     errors = []
     successful_predictions = 0
     failed_predictions = 0
-    
-    # Process each transaction
-    for i, txn in enumerate(batch_request.transactions):
+
+    # Assemble per-transaction responses from the vectorized results
+    for i, txn in enumerate(transactions):
         try:
-            prediction = _predict_single_transaction(txn)
-            results.append(prediction)
+            results.append(FraudPredictionResponse(
+                transaction_id=txn.transaction_id,
+                customer_id=txn.customer_id,
+                fraud_prediction=int(preds[i]),
+                fraud_probability=round(float(probs[i]), 4),
+                risk_level=str(levels[i])
+            ))
             successful_predictions += 1
-            
+
         except Exception as e:
             failed_predictions += 1
             errors.append({
@@ -258,9 +452,9 @@ async def predict_fraud_batch(batch_request: BatchTransactionRequest) -> BatchPr
                 "transaction_id": txn.transaction_id,
                 "error": str(e)
             })
-    
+
     return BatchPredictionResponse(
-        total_transactions=len(batch_request.transactions),
+        total_transactions=len(transactions),
         successful_predictions=successful_predictions,
         failed_predictions=failed_predictions,
         results=results,
@@ -292,32 +486,37 @@ async def reload_models() -> Dict[str, Any]:
         )
 
 
+# Risk configuration is derived entirely from settings, which are fixed for
+# the process lifetime - build the payload once at import
+_RISK_CONFIG_PAYLOAD = {
+    "risk_thresholds": {
+        "low_threshold": settings.FRAUD_RISK_LOW_THRESHOLD,
+        "high_threshold": settings.FRAUD_RISK_HIGH_THRESHOLD,
+        "explanation": f"0.0 - {settings.FRAUD_RISK_LOW_THRESHOLD-0.01:.2f}: {settings.FRAUD_RISK_NORMAL_LABEL}, "
+                       f"{settings.FRAUD_RISK_LOW_THRESHOLD:.2f} - {settings.FRAUD_RISK_HIGH_THRESHOLD-0.01:.2f}: {settings.FRAUD_RISK_MODERATE_LABEL}, "
+                       f"{settings.FRAUD_RISK_HIGH_THRESHOLD:.2f} - 1.0: {settings.FRAUD_RISK_HIGH_LABEL}"
+    },
+    "risk_labels": {
+        "normal": settings.FRAUD_RISK_NORMAL_LABEL,
+        "moderate": settings.FRAUD_RISK_MODERATE_LABEL,
+        "high": settings.FRAUD_RISK_HIGH_LABEL
+    },
+    "environment_variables": {
+        "FRAUD_RISK_LOW_THRESHOLD": f"Set to {settings.FRAUD_RISK_LOW_THRESHOLD} (default: 0.3)",
+        "FRAUD_RISK_HIGH_THRESHOLD": f"Set to {settings.FRAUD_RISK_HIGH_THRESHOLD} (default: 0.7)",
+        "FRAUD_RISK_NORMAL_LABEL": f"Set to '{settings.FRAUD_RISK_NORMAL_LABEL}' (default: 'Normal / No Risk')",
+        "FRAUD_RISK_MODERATE_LABEL": f"Set to '{settings.FRAUD_RISK_MODERATE_LABEL}' (default: 'Moderate Risk (Verify)')",
+        "FRAUD_RISK_HIGH_LABEL": f"Set to '{settings.FRAUD_RISK_HIGH_LABEL}' (default: 'High Risk (Avoid)')"
+    }
+}
+
+
 @router.get("/risk-config")
 async def get_risk_configuration() -> Dict[str, Any]:
     """
     Get current fraud risk thresholds and labels configuration.
-    
+
     Returns:
         Dictionary with current risk configuration settings
     """
-    return {
-        "risk_thresholds": {
-            "low_threshold": settings.FRAUD_RISK_LOW_THRESHOLD,
-            "high_threshold": settings.FRAUD_RISK_HIGH_THRESHOLD,
-            "explanation": f"0.0 - {settings.FRAUD_RISK_LOW_THRESHOLD-0.01:.2f}: {settings.FRAUD_RISK_NORMAL_LABEL}, "
-                         f"{settings.FRAUD_RISK_LOW_THRESHOLD:.2f} - {settings.FRAUD_RISK_HIGH_THRESHOLD-0.01:.2f}: {settings.FRAUD_RISK_MODERATE_LABEL}, "
-                         f"{settings.FRAUD_RISK_HIGH_THRESHOLD:.2f} - 1.0: {settings.FRAUD_RISK_HIGH_LABEL}"
-        },
-        "risk_labels": {
-            "normal": settings.FRAUD_RISK_NORMAL_LABEL,
-            "moderate": settings.FRAUD_RISK_MODERATE_LABEL,
-            "high": settings.FRAUD_RISK_HIGH_LABEL
-        },
-        "environment_variables": {
-            "FRAUD_RISK_LOW_THRESHOLD": f"Set to {settings.FRAUD_RISK_LOW_THRESHOLD} (default: 0.3)",
-            "FRAUD_RISK_HIGH_THRESHOLD": f"Set to {settings.FRAUD_RISK_HIGH_THRESHOLD} (default: 0.7)",
-            "FRAUD_RISK_NORMAL_LABEL": f"Set to '{settings.FRAUD_RISK_NORMAL_LABEL}' (default: 'Normal / No Risk')",
-            "FRAUD_RISK_MODERATE_LABEL": f"Set to '{settings.FRAUD_RISK_MODERATE_LABEL}' (default: 'Moderate Risk (Verify)')",
-            "FRAUD_RISK_HIGH_LABEL": f"Set to '{settings.FRAUD_RISK_HIGH_LABEL}' (default: 'High Risk (Avoid)')"
-        }
-    }
\ No newline at end of file
+    return _RISK_CONFIG_PAYLOAD
\ No newline at end of file
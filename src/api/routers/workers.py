@@ -4,10 +4,12 @@ Worker endpoints - Complete CRUD operations for workers.
 from datetime import datetime
 from typing import List, Optional
 from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy.orm import Session
-from pydantic import BaseModel, Field
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from pydantic import BaseModel, ConfigDict, Field
 
-from src.db.database import get_db
+from src.db.database import get_async_db
 from src.db.models import Worker
 
 router = APIRouter()
@@ -40,72 +42,102 @@ class WorkerUpdate(BaseModel):
 class WorkerResponse(WorkerBase):
     """Worker response model."""
     WORKER_ID: int
-    
-    class Config:
-        from_attributes = True  # For Pydantic v2
+
+    model_config = ConfigDict(from_attributes=True)
 
 
 # CRUD Endpoints
+# NOTE: These run on the async engine (aioodbc) - queries are awaited on the
+# event loop instead of hopping through the threadpool per request.
+
+# Column projection reused by the read endpoints - fetching plain tuples
+# instead of full ORM objects skips identity-map and Pydantic re-validation
+_WORKER_COLUMNS = (
+    Worker.WORKER_ID,
+    Worker.FIRST_NAME,
+    Worker.LAST_NAME,
+    Worker.SALARY,
+    Worker.JOINING_DATE,
+    Worker.DEPARTMENT,
+)
 
-@router.get("/workers", response_model=List[WorkerResponse])
+
+@router.get("/workers")
 async def get_workers(
-    skip: int = Query(0, ge=0, description="Number of records to skip"),
+    skip: int = Query(0, ge=0, description="Number of records to skip (legacy offset pagination)"),
     limit: int = Query(100, ge=1, le=1000, description="Maximum number of records to return"),
     department: Optional[str] = Query(None, description="Filter by department name"),
-    db: Session = Depends(get_db)
-) -> List[WorkerResponse]:
+    after_id: Optional[int] = Query(None, ge=0, description="Return workers with WORKER_ID greater than this (keyset pagination)"),
+    db: AsyncSession = Depends(get_async_db)
+) -> ORJSONResponse:
     """
     Get all workers from the database with optional filtering and pagination.
-    
+
+    Prefer `after_id` (keyset pagination) for deep pages: SQL Server resolves
+    it with an index seek on WORKER_ID, whereas OFFSET scans and discards
+    `skip` rows. The keyset variant returns `{"items": [...], "next_cursor"}`;
+    the legacy `skip` variant keeps returning a plain list.
+
     Args:
-        skip: Number of records to skip (for pagination)
+        skip: Number of records to skip (legacy offset pagination)
         limit: Maximum number of records to return (1-1000)
         department: Filter by department name (optional)
+        after_id: Cursor for keyset pagination; pass the previous page's next_cursor
         db: Database session
-        
+
     Returns:
-        List of workers matching the criteria
+        List of workers matching the criteria (or items + next_cursor with after_id)
     """
-    query = db.query(Worker)
-    
+    stmt = select(*_WORKER_COLUMNS)
+
     # Apply department filter if provided
     if department:
-        query = query.filter(Worker.DEPARTMENT == department)
-    
+        stmt = stmt.where(Worker.DEPARTMENT == department)
+
     # Apply ordering (required by SQL Server for OFFSET/LIMIT)
-    query = query.order_by(Worker.WORKER_ID)
-    
-    # Apply pagination
-    workers = query.offset(skip).limit(limit).all()
-    return workers
+    stmt = stmt.order_by(Worker.WORKER_ID)
+
+    # Keyset pagination: seek past the cursor instead of scanning an offset
+    if after_id is not None:
+        result = await db.execute(stmt.where(Worker.WORKER_ID > after_id).limit(limit))
+        rows = result.all()
+        items = [dict(row._mapping) for row in rows]
+        next_cursor = rows[-1].WORKER_ID if len(rows) == limit else None
+        return ORJSONResponse({"items": items, "next_cursor": next_cursor})
 
+    # Legacy offset pagination; serialize the row mappings directly with
+    # orjson instead of re-validating each row through WorkerResponse
+    result = await db.execute(stmt.offset(skip).limit(limit))
+    return ORJSONResponse([dict(row._mapping) for row in result.all()])
 
-@router.get("/workers/{worker_id}", response_model=WorkerResponse)
-async def get_worker(worker_id: int, db: Session = Depends(get_db)) -> WorkerResponse:
+
+@router.get("/workers/{worker_id}")
+async def get_worker(worker_id: int, db: AsyncSession = Depends(get_async_db)) -> ORJSONResponse:
     """
     Get a single worker by ID.
-    
+
     Args:
         worker_id: The ID of the worker to retrieve
         db: Database session
-        
+
     Returns:
         Worker details
-        
+
     Raises:
         HTTPException: 404 if worker not found
     """
-    worker = db.query(Worker).filter(Worker.WORKER_ID == worker_id).first()
-    if not worker:
+    result = await db.execute(select(*_WORKER_COLUMNS).where(Worker.WORKER_ID == worker_id))
+    row = result.first()
+    if not row:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Worker with ID {worker_id} not found"
         )
-    return worker
+    return ORJSONResponse(dict(row._mapping))
 
 
 @router.post("/workers", response_model=WorkerResponse, status_code=status.HTTP_201_CREATED)
-async def create_worker(worker: WorkerCreate, db: Session = Depends(get_db)) -> WorkerResponse:
+async def create_worker(worker: WorkerCreate, db: AsyncSession = Depends(get_async_db)) -> WorkerResponse:
     """
     Create a new worker.
     
@@ -127,17 +159,25 @@ async def create_worker(worker: WorkerCreate, db: Session = Depends(get_db)) ->
     
     # Add to database
     db.add(db_worker)
-    db.commit()
-    db.refresh(db_worker)  # Get the assigned ID
-    
-    return db_worker
+    await db.commit()
+    await db.refresh(db_worker)  # Get the assigned ID
+
+    # DB-sourced values are trusted - model_construct skips re-validation
+    return WorkerResponse.model_construct(
+        WORKER_ID=db_worker.WORKER_ID,
+        FIRST_NAME=db_worker.FIRST_NAME,
+        LAST_NAME=db_worker.LAST_NAME,
+        SALARY=db_worker.SALARY,
+        JOINING_DATE=db_worker.JOINING_DATE,
+        DEPARTMENT=db_worker.DEPARTMENT
+    )
 
 
 @router.put("/workers/{worker_id}", response_model=WorkerResponse)
 async def update_worker(
-    worker_id: int, 
-    worker: WorkerUpdate, 
-    db: Session = Depends(get_db)
+    worker_id: int,
+    worker: WorkerUpdate,
+    db: AsyncSession = Depends(get_async_db)
 ) -> WorkerResponse:
     """
     Update an existing worker.
@@ -154,27 +194,35 @@ async def update_worker(
         HTTPException: 404 if worker not found
     """
     # Find the worker
-    db_worker = db.query(Worker).filter(Worker.WORKER_ID == worker_id).first()
+    db_worker = await db.get(Worker, worker_id)
     if not db_worker:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Worker with ID {worker_id} not found"
         )
-    
+
     # Update only the provided fields
-    update_data = worker.dict(exclude_unset=True)
+    update_data = worker.model_dump(exclude_unset=True)
     for field, value in update_data.items():
         setattr(db_worker, field, value)
-    
+
     # Save changes
-    db.commit()
-    db.refresh(db_worker)
-    
-    return db_worker
+    await db.commit()
+    await db.refresh(db_worker)
+
+    # DB-sourced values are trusted - model_construct skips re-validation
+    return WorkerResponse.model_construct(
+        WORKER_ID=db_worker.WORKER_ID,
+        FIRST_NAME=db_worker.FIRST_NAME,
+        LAST_NAME=db_worker.LAST_NAME,
+        SALARY=db_worker.SALARY,
+        JOINING_DATE=db_worker.JOINING_DATE,
+        DEPARTMENT=db_worker.DEPARTMENT
+    )
 
 
 @router.delete("/workers/{worker_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_worker(worker_id: int, db: Session = Depends(get_db)) -> None:
+async def delete_worker(worker_id: int, db: AsyncSession = Depends(get_async_db)) -> None:
     """
     Delete a worker by ID.
     
@@ -186,54 +234,71 @@ async def delete_worker(worker_id: int, db: Session = Depends(get_db)) -> None:
         HTTPException: 404 if worker not found
     """
     # Find the worker
-    db_worker = db.query(Worker).filter(Worker.WORKER_ID == worker_id).first()
+    db_worker = await db.get(Worker, worker_id)
     if not db_worker:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Worker with ID {worker_id} not found"
         )
-    
+
     # Delete the worker
-    db.delete(db_worker)
-    db.commit()
+    await db.delete(db_worker)
+    await db.commit()
 
 
 # Additional utility endpoints
 
 @router.get("/workers/departments/list", response_model=List[str])
-async def get_departments(db: Session = Depends(get_db)) -> List[str]:
+async def get_departments(db: AsyncSession = Depends(get_async_db)) -> List[str]:
     """
     Get a list of all unique departments.
-    
+
     Returns:
         List of department names
     """
-    departments = db.query(Worker.DEPARTMENT).distinct().all()
-    return [dept[0] for dept in departments if dept[0]]
+    # Filter out NULL/empty server-side so SQL Server answers from the
+    # DEPARTMENT index instead of shipping every row for a Python filter
+    result = await db.execute(
+        select(Worker.DEPARTMENT).where(
+            Worker.DEPARTMENT.isnot(None),
+            Worker.DEPARTMENT != ''
+        ).distinct()
+    )
+    return [dept[0] for dept in result.all()]
 
 
 @router.get("/workers/stats/summary")
-async def get_worker_stats(db: Session = Depends(get_db)):
+async def get_worker_stats(db: AsyncSession = Depends(get_async_db)):
     """
     Get summary statistics about workers.
-    
+
     Returns:
         Dictionary with worker statistics
     """
-    from sqlalchemy import func
-    
-    # Get basic stats
-    total_workers = db.query(Worker).count()
-    avg_salary = db.query(func.avg(Worker.SALARY)).scalar() or 0
-    min_salary = db.query(func.min(Worker.SALARY)).scalar() or 0
-    max_salary = db.query(func.max(Worker.SALARY)).scalar() or 0
-    
+    # Get all basic stats in a single round trip - SQL Server computes the
+    # aggregates in one table scan instead of four separate queries
+    stats = await db.execute(
+        select(
+            func.count(Worker.WORKER_ID),
+            func.avg(Worker.SALARY),
+            func.min(Worker.SALARY),
+            func.max(Worker.SALARY)
+        )
+    )
+    total_workers, avg_salary, min_salary, max_salary = stats.one()
+    avg_salary = avg_salary or 0
+    min_salary = min_salary or 0
+    max_salary = max_salary or 0
+
     # Get department counts
-    dept_counts = db.query(
-        Worker.DEPARTMENT,
-        func.count(Worker.WORKER_ID).label('count')
-    ).group_by(Worker.DEPARTMENT).all()
-    
+    dept_result = await db.execute(
+        select(
+            Worker.DEPARTMENT,
+            func.count(Worker.WORKER_ID).label('count')
+        ).group_by(Worker.DEPARTMENT)
+    )
+    dept_counts = dept_result.all()
+
     return {
         "total_workers": total_workers,
         "salary_stats": {
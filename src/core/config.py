@@ -1,111 +1,173 @@
 """
 Application configuration settings.
 """
+import json
 import os
-from typing import List, Optional
-from pydantic import Field
-from pydantic_settings import BaseSettings
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import List
+from urllib.parse import quote_plus
 
+from dotenv import load_dotenv
+
+# Load .env into the process environment once at import (existing env vars
+# win, matching the old pydantic-settings precedence)
+load_dotenv(".env", encoding="utf-8")
+
+
+# Tiny explicit-cast helpers instead of pydantic validation: each field costs
+# one os.environ.get plus a cast, keeping cold-start import time minimal
+def _env_str(key: str, default: str) -> str:
+    return os.environ.get(key, default)
+
+
+def _env_int(key: str, default: int) -> int:
+    value = os.environ.get(key)
+    return default if value is None else int(value)
+
+
+def _env_float(key: str, default: float) -> float:
+    value = os.environ.get(key)
+    return default if value is None else float(value)
+
+
+def _env_bool(key: str, default: bool) -> bool:
+    value = os.environ.get(key)
+    if value is None:
+        return default
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
+
+def _env_list(key: str, default: List[str]) -> List[str]:
+    """Parse a JSON array (pydantic-settings style) or comma-separated list."""
+    value = os.environ.get(key)
+    if value is None:
+        return list(default)
+    value = value.strip()
+    if value.startswith("["):
+        return json.loads(value)
+    return [item.strip() for item in value.split(",") if item.strip()]
+
+
+@dataclass(frozen=True, slots=True)
+class Settings:
+    """Application settings loaded from environment variables.
+
+    Plain frozen dataclass rather than pydantic BaseSettings: no model
+    validation pass over every field at construction, so cold-start cost is
+    one environ lookup + cast per field. slots=True also trims per-instance
+    memory. Public attribute names are unchanged from the pydantic version.
+    """
 
-class Settings(BaseSettings):
-    """Application settings loaded from environment variables."""
-    
     # ===== CURRENTLY ACTIVE SETTINGS =====
-    
+
     # Application settings - Used in main.py and health endpoints
-    APP_NAME: str = Field(default="ML-GenAI FastAPI", env="APP_NAME")  # FastAPI title and startup logs
-    VERSION: str = Field(default="1.0.0", env="VERSION")  # API version and health checks
-    ENVIRONMENT: str = Field(default="development", env="ENVIRONMENT")  # Environment tracking
-    DEBUG: bool = Field(default=True, env="DEBUG")  # Controls SQL logging and uvicorn reload
-    
+    APP_NAME: str = field(default_factory=lambda: _env_str("APP_NAME", "ML-GenAI FastAPI"))  # FastAPI title and startup logs
+    VERSION: str = field(default_factory=lambda: _env_str("VERSION", "1.0.0"))  # API version and health checks
+    ENVIRONMENT: str = field(default_factory=lambda: _env_str("ENVIRONMENT", "development"))  # Environment tracking
+    DEBUG: bool = field(default_factory=lambda: _env_bool("DEBUG", True))  # Controls uvicorn reload and debug behavior
+    SQL_ECHO: bool = field(default_factory=lambda: _env_bool("SQL_ECHO", False))  # Log every SQL statement (expensive; keep off outside debugging)
+
     # Server settings - Used in main.py for uvicorn server
-    HOST: str = Field(default="0.0.0.0", env="HOST")  # Server bind address
-    PORT: int = Field(default=8000, env="PORT")  # Server port
-    
+    HOST: str = field(default_factory=lambda: _env_str("HOST", "0.0.0.0"))  # Server bind address
+    PORT: int = field(default_factory=lambda: _env_int("PORT", 8000))  # Server port
+
     # CORS settings - Used in main.py for cross-origin requests
-    ALLOWED_ORIGINS: List[str] = Field(default=["*"], env="ALLOWED_ORIGINS")  # CORS allowed origins
-    
+    ALLOWED_ORIGINS: List[str] = field(default_factory=lambda: _env_list("ALLOWED_ORIGINS", ["*"]))  # CORS allowed origins
+
     # SQL Server settings - Used in database.py for connection
-    SQL_SERVER_HOST: str = Field(default="ysidevdb.yardiapp.com", env="SQL_SERVER_HOST")  # Database host
-    SQL_SERVER_PORT: int = Field(default=30040, env="SQL_SERVER_PORT")  # Database port
-    SQL_SERVER_DATABASE: str = Field(default="collectprocessoradmin", env="SQL_SERVER_DATABASE")  # Database name
-    SQL_SERVER_USERNAME: str = Field(default="collectprocessordev", env="SQL_SERVER_USERNAME")  # Database user
-    SQL_SERVER_PASSWORD: str = Field(default="collectprocessordev", env="SQL_SERVER_PASSWORD")  # Database password
-    SQL_SERVER_DRIVER: str = Field(default="ODBC Driver 17 for SQL Server", env="SQL_SERVER_DRIVER")  # ODBC driver
-    SQL_SERVER_TRUST_CERT: bool = Field(default=True, env="SQL_SERVER_TRUST_CERT")  # Trust server certificate
-    SQL_SERVER_ENCRYPT: bool = Field(default=True, env="SQL_SERVER_ENCRYPT")  # Encrypt connection
-    
+    SQL_SERVER_HOST: str = field(default_factory=lambda: _env_str("SQL_SERVER_HOST", "ysidevdb.yardiapp.com"))  # Database host
+    SQL_SERVER_PORT: int = field(default_factory=lambda: _env_int("SQL_SERVER_PORT", 30040))  # Database port
+    SQL_SERVER_DATABASE: str = field(default_factory=lambda: _env_str("SQL_SERVER_DATABASE", "collectprocessoradmin"))  # Database name
+    SQL_SERVER_USERNAME: str = field(default_factory=lambda: _env_str("SQL_SERVER_USERNAME", "collectprocessordev"))  # Database user
+    SQL_SERVER_PASSWORD: str = field(default_factory=lambda: _env_str("SQL_SERVER_PASSWORD", "collectprocessordev"))  # Database password
+    SQL_SERVER_DRIVER: str = field(default_factory=lambda: _env_str("SQL_SERVER_DRIVER", "ODBC Driver 17 for SQL Server"))  # ODBC driver
+    SQL_SERVER_TRUST_CERT: bool = field(default_factory=lambda: _env_bool("SQL_SERVER_TRUST_CERT", True))  # Trust server certificate
+    SQL_SERVER_ENCRYPT: bool = field(default_factory=lambda: _env_bool("SQL_SERVER_ENCRYPT", True))  # Encrypt connection
+
     # Database behavior settings
-    AUTO_CREATE_TABLES: bool = Field(default=False, env="AUTO_CREATE_TABLES")  # DISABLED: Tables created manually via SQL
-    
+    AUTO_CREATE_TABLES: bool = field(default_factory=lambda: _env_bool("AUTO_CREATE_TABLES", False))  # DISABLED: Tables created manually via SQL
+
+    # Connection pool settings - Used in database.py, tunable without redeploy
+    DB_POOL_SIZE: int = field(default_factory=lambda: _env_int("DB_POOL_SIZE", 20))  # Persistent connections kept in the pool
+    DB_MAX_OVERFLOW: int = field(default_factory=lambda: _env_int("DB_MAX_OVERFLOW", 40))  # Extra connections allowed under burst load
+    DB_POOL_TIMEOUT: int = field(default_factory=lambda: _env_int("DB_POOL_TIMEOUT", 5))  # Seconds to wait for a free connection
+    DB_POOL_RECYCLE: int = field(default_factory=lambda: _env_int("DB_POOL_RECYCLE", 1500))  # Recycle just under SQL Server's idle timeout
+
     # ML settings - Used in health.py for model directory checking and ml.py for predictions
-    ML_MODEL_PATH: str = Field(default="./models", env="ML_MODEL_PATH")  # Path to ML model files
-    
+    ML_MODEL_PATH: str = field(default_factory=lambda: _env_str("ML_MODEL_PATH", "./models"))  # Path to ML model files
+
     # Fraud Detection Risk Thresholds - Used in ml.py for risk categorization
-    FRAUD_RISK_LOW_THRESHOLD: float = Field(default=0.3, env="FRAUD_RISK_LOW_THRESHOLD")  # Below this = Normal risk
-    FRAUD_RISK_HIGH_THRESHOLD: float = Field(default=0.7, env="FRAUD_RISK_HIGH_THRESHOLD")  # Above this = High risk
-    
+    FRAUD_RISK_LOW_THRESHOLD: float = field(default_factory=lambda: _env_float("FRAUD_RISK_LOW_THRESHOLD", 0.3))  # Below this = Normal risk
+    FRAUD_RISK_HIGH_THRESHOLD: float = field(default_factory=lambda: _env_float("FRAUD_RISK_HIGH_THRESHOLD", 0.7))  # Above this = High risk
+
     # Fraud Detection Risk Labels - Used in ml.py for risk level descriptions
-    FRAUD_RISK_NORMAL_LABEL: str = Field(default="Normal / No Risk", env="FRAUD_RISK_NORMAL_LABEL")  # Low risk label
-    FRAUD_RISK_MODERATE_LABEL: str = Field(default="Moderate Risk (Verify)", env="FRAUD_RISK_MODERATE_LABEL")  # Medium risk label
-    FRAUD_RISK_HIGH_LABEL: str = Field(default="High Risk (Avoid)", env="FRAUD_RISK_HIGH_LABEL")  # High risk label
-    
+    FRAUD_RISK_NORMAL_LABEL: str = field(default_factory=lambda: _env_str("FRAUD_RISK_NORMAL_LABEL", "Normal / No Risk"))  # Low risk label
+    FRAUD_RISK_MODERATE_LABEL: str = field(default_factory=lambda: _env_str("FRAUD_RISK_MODERATE_LABEL", "Moderate Risk (Verify)"))  # Medium risk label
+    FRAUD_RISK_HIGH_LABEL: str = field(default_factory=lambda: _env_str("FRAUD_RISK_HIGH_LABEL", "High Risk (Avoid)"))  # High risk label
+
+    # Connection strings assembled once in __post_init__; plain attribute
+    # reads everywhere else (repr=False keeps the password out of repr)
+    sql_server_connection_string: str = field(init=False, repr=False, default="")
+    sql_server_async_connection_string: str = field(init=False, repr=False, default="")
+
     # ===== COMMENTED OUT - NOT CURRENTLY USED =====
-    
+
     # # Security settings - Uncomment when implementing JWT tokens or sessions
-    # SECRET_KEY: str = Field(default="your-secret-key-change-this", env="SECRET_KEY")  # For JWT tokens, sessions
-    
+    # SECRET_KEY: str = field(default_factory=lambda: _env_str("SECRET_KEY", "your-secret-key-change-this"))  # For JWT tokens, sessions
+
     # # ML settings - Uncomment when implementing ML model loading
-    # MAX_MODEL_SIZE_MB: int = Field(default=500, env="MAX_MODEL_SIZE_MB")  # Max model file size limit
-    # DEFAULT_MODEL_TIMEOUT: int = Field(default=30, env="DEFAULT_MODEL_TIMEOUT")  # Model prediction timeout
-    
-    # # GenAI settings - Uncomment when implementing GenAI integrations
-    # OPENAI_API_KEY: Optional[str] = Field(default=None, env="OPENAI_API_KEY")  # OpenAI API access
-    # AZURE_OPENAI_API_KEY: Optional[str] = Field(default=None, env="AZURE_OPENAI_API_KEY")  # Azure OpenAI access
-    # AZURE_OPENAI_ENDPOINT: Optional[str] = Field(default=None, env="AZURE_OPENAI_ENDPOINT")  # Azure endpoint URL
-    # HUGGINGFACE_API_KEY: Optional[str] = Field(default=None, env="HUGGINGFACE_API_KEY")  # HuggingFace API access
-    
+    # MAX_MODEL_SIZE_MB: int = field(default_factory=lambda: _env_int("MAX_MODEL_SIZE_MB", 500))  # Max model file size limit
+    # DEFAULT_MODEL_TIMEOUT: int = field(default_factory=lambda: _env_int("DEFAULT_MODEL_TIMEOUT", 30))  # Model prediction timeout
+
     # # Logging settings - Uncomment when implementing structured logging
-    # LOG_LEVEL: str = Field(default="INFO", env="LOG_LEVEL")  # Python logging level
-    # LOG_FORMAT: str = Field(default="%(asctime)s - %(name)s - %(levelname)s - %(message)s", env="LOG_FORMAT")  # Log format
-    
-    # ===== ACTIVE PROPERTIES =====
-    @property
-    def sql_server_connection_string(self) -> str:
-        """Generate SQL Server connection string - USED in database.py"""
-        driver_name = self.SQL_SERVER_DRIVER.replace(' ', '+')
-        
+    # LOG_LEVEL: str = field(default_factory=lambda: _env_str("LOG_LEVEL", "INFO"))  # Python logging level
+
+    def _build_connection_string(self, dialect: str) -> str:
+        """Assemble a SQLAlchemy URL for the given mssql dialect."""
+        # URL-encode credentials and driver name so passwords containing
+        # @, :, / or spaces don't corrupt URL parsing
+        username = quote_plus(self.SQL_SERVER_USERNAME)
+        password = quote_plus(self.SQL_SERVER_PASSWORD)
+        driver_name = quote_plus(self.SQL_SERVER_DRIVER)
+
         # Basic connection string
         base_string = (
-            f"mssql+pyodbc://{self.SQL_SERVER_USERNAME}:{self.SQL_SERVER_PASSWORD}@"
+            f"{dialect}://{username}:{password}@"
             f"{self.SQL_SERVER_HOST}:{self.SQL_SERVER_PORT}/{self.SQL_SERVER_DATABASE}"
             f"?driver={driver_name}"
         )
-        
+
         # Only add SSL parameters for modern drivers
         if "ODBC Driver" in self.SQL_SERVER_DRIVER:
             trust_cert = "yes" if self.SQL_SERVER_TRUST_CERT else "no"
             encrypt = "yes" if self.SQL_SERVER_ENCRYPT else "no"
             base_string += f"&TrustServerCertificate={trust_cert}&Encrypt={encrypt}"
-        
+
         return base_string
-    
-    # ===== COMMENTED OUT PROPERTIES - NOT CURRENTLY USED =====
-    # @property
-    # def sql_server_async_connection_string(self) -> str:
-    #     """Generate async SQL Server connection string - For future async database operations"""
-    #     trust_cert = "yes" if self.SQL_SERVER_TRUST_CERT else "no"
-    #     return (
-    #         f"mssql+aioodbc://{self.SQL_SERVER_USERNAME}:{self.SQL_SERVER_PASSWORD}@"
-    #         f"{self.SQL_SERVER_HOST}:{self.SQL_SERVER_PORT}/{self.SQL_SERVER_DATABASE}"
-    #         f"?driver={self.SQL_SERVER_DRIVER.replace(' ', '+')}&TrustServerCertificate={trust_cert}"
-    #     )
-    
-    class Config:
-        env_file = ".env"
-        env_file_encoding = "utf-8"
-        case_sensitive = True
-
-
-# Create global settings instance
-settings = Settings()
\ No newline at end of file
+
+    def __post_init__(self) -> None:
+        # object.__setattr__ because the dataclass is frozen
+        object.__setattr__(
+            self, "sql_server_connection_string",
+            self._build_connection_string("mssql+pyodbc")
+        )
+        object.__setattr__(
+            self, "sql_server_async_connection_string",
+            self._build_connection_string("mssql+aioodbc")
+        )
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """
+    Return the process-wide Settings instance.
+
+    Cached so the environment scan and casts run exactly once per process,
+    no matter how many callers ask for settings.
+    """
+    return Settings()
+
+
+# Create global settings instance (kept so `from src.core.config import settings` works)
+settings = get_settings()
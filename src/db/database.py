@@ -1,36 +1,106 @@
 """
 Database connection and session management.
 """
-from sqlalchemy import create_engine, MetaData
-from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker, Session
-from typing import Generator
+from functools import lru_cache
+from sqlalchemy import create_engine, event, Engine, MetaData
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import DeclarativeBase, sessionmaker, Session
+from typing import AsyncGenerator, Generator, Optional
+import asyncio
 import logging
+import pyodbc
 
 from src.core.config import settings
 
+# Enable ODBC Driver Manager connection pooling before the first connection
+# is opened, so reconnects skip the full SQL Server handshake
+pyodbc.pooling = True
+
 # Set up logging
 logger = logging.getLogger(__name__)
 
-# Create SQLAlchemy engine
-connection_string = settings.sql_server_connection_string
-logger.info(f"Database config - Host: {settings.SQL_SERVER_HOST}:{settings.SQL_SERVER_PORT}")
-logger.info(f"Database config - Database: {settings.SQL_SERVER_DATABASE}")
-logger.info(f"Database config - Driver: {settings.SQL_SERVER_DRIVER}")
-logger.info(f"Using connection string: {connection_string.replace(settings.SQL_SERVER_PASSWORD, '***')}")
+# Compiled-statement caches shared across all executions on each engine:
+# repeated queries reuse the compiled SQL + bind setup instead of
+# recompiling. One dict per engine since the dialects differ.
+_COMPILED_CACHE: dict = {}
+_ASYNC_COMPILED_CACHE: dict = {}
+
+# Rows the pyodbc cursor prefetches per fetchmany round-trip; matched to
+# the yield_per batch size used by streaming bulk reads
+_CURSOR_ARRAYSIZE = 1000
+
+
+def _set_cursor_arraysize(conn, cursor, statement, parameters, context, executemany):
+    cursor.arraysize = _CURSOR_ARRAYSIZE
+
+
+# Engines are built lazily behind lru_cache factories so importing this
+# module (e.g. during pytest collection) never logs, resolves DNS or
+# touches the network - only the first real DB use pays for engine setup.
 
-engine = create_engine(
-    connection_string,
-    echo=settings.DEBUG,  # Log SQL queries in debug mode
-    pool_pre_ping=True,   # Enable connection pool pre-ping
-    pool_recycle=300,     # Recycle connections every 5 minutes
-)
+@lru_cache(maxsize=1)
+def get_engine() -> Engine:
+    """Build the sync SQLAlchemy engine on first use."""
+    connection_string = settings.sql_server_connection_string
+    # Single record (and single write to the log sink) instead of one per
+    # field; %-style args so nothing is formatted when INFO is filtered out
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(
+            "Database config - host=%s:%s database=%s driver=%s connection_string=%s",
+            settings.SQL_SERVER_HOST,
+            settings.SQL_SERVER_PORT,
+            settings.SQL_SERVER_DATABASE,
+            settings.SQL_SERVER_DRIVER,
+            # Password-masking replace scans the whole string - only done
+            # when the record will actually be emitted
+            connection_string.replace(settings.SQL_SERVER_PASSWORD, '***'),
+        )
+
+    engine = create_engine(
+        connection_string,
+        echo=settings.SQL_ECHO,                 # Per-statement logging costs even when unread; opt-in only
+        execution_options={"compiled_cache": _COMPILED_CACHE},
+        pool_pre_ping=False,                    # No SELECT 1 round-trip per checkout; keepalive pings every idle connection instead
+        pool_size=settings.DB_POOL_SIZE,        # Persistent connections kept in the pool
+        max_overflow=settings.DB_MAX_OVERFLOW,  # Extra connections allowed under burst load
+        pool_timeout=settings.DB_POOL_TIMEOUT,  # Fail fast when the pool is exhausted
+        pool_recycle=settings.DB_POOL_RECYCLE,  # Recycle connections periodically
+        pool_use_lifo=True,                     # Reuse the hottest connection (warm TCP/TLS state)
+        fast_executemany=True,                  # Batch parameter arrays on bulk inserts
+    )
+    event.listens_for(engine, "before_cursor_execute")(_set_cursor_arraysize)
+    return engine
+
+
+@lru_cache(maxsize=1)
+def get_async_engine() -> AsyncEngine:
+    """Build the async (aioodbc) engine on first use.
+
+    Request handlers await queries on the event loop instead of hopping
+    through the threadpool for every DB call. The sync engine stays for
+    startup tasks (init_db, connection checks).
+    """
+    return create_async_engine(
+        settings.sql_server_async_connection_string,
+        echo=settings.SQL_ECHO,
+        execution_options={"compiled_cache": _ASYNC_COMPILED_CACHE},
+        pool_pre_ping=False,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+        pool_recycle=settings.DB_POOL_RECYCLE,
+        pool_use_lifo=True,
+    )
 
-# Create SessionLocal class
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
-# Create Base class for models
-Base = declarative_base()
+# Session factories start unbound; get_db/get_async_db bind them to the
+# lazily built engines on first use
+SessionLocal = sessionmaker(autocommit=False, autoflush=False)
+AsyncSessionLocal = async_sessionmaker(expire_on_commit=False)
+
+# Create Base class for models (SQLAlchemy 2.0 declarative style)
+class Base(DeclarativeBase):
+    pass
 
 # Metadata for reflection and schema operations
 metadata = MetaData()
@@ -41,17 +111,35 @@ def get_db() -> Generator[Session, None, None]:
     Dependency to get database session.
     Yields a SQLAlchemy session and ensures it's closed after use.
     """
+    if SessionLocal.kw.get("bind") is None:
+        SessionLocal.configure(bind=get_engine())
     db = SessionLocal()
     try:
         yield db
     except Exception as e:
-        logger.error(f"Database session error: {e}")
+        logger.error("Database session error: %s", e)
         db.rollback()
         raise
     finally:
         db.close()
 
 
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Dependency to get an async database session.
+    Yields an AsyncSession and ensures it's closed after use.
+    """
+    if AsyncSessionLocal.kw.get("bind") is None:
+        AsyncSessionLocal.configure(bind=get_async_engine())
+    async with AsyncSessionLocal() as db:
+        try:
+            yield db
+        except Exception as e:
+            logger.error("Database session error: %s", e)
+            await db.rollback()
+            raise
+
+
 def init_db() -> None:
     """
     Initialize database tables.
@@ -61,26 +149,107 @@ def init_db() -> None:
     """
     if settings.AUTO_CREATE_TABLES:
         try:
-            Base.metadata.create_all(bind=engine)
+            Base.metadata.create_all(bind=get_engine())
             logger.info("Database tables created automatically")
         except Exception as e:
-            logger.error(f"Failed to create database tables: {e}")
+            logger.error("Failed to create database tables: %s", e)
             raise
     else:
         logger.warning("init_db() called but AUTO_CREATE_TABLES is disabled")
         logger.info("Create tables manually using: sqlcmd -i scripts/create_tables.sql")
 
 
+# With pool_pre_ping off there is no per-checkout SELECT 1 round-trip;
+# instead a background task pings every idle pooled connection each cycle
+# so dead connections are noticed and replaced between requests rather
+# than inside one. Checking out all idle connections at once forces
+# distinct connections despite pool_use_lifo - a single checkout would
+# only ever ping the most recently used (least stale) one.
+_KEEPALIVE_INTERVAL_SECONDS = 60.0
+_keepalive_task: Optional[asyncio.Task] = None
+
+
+def _ping_sync_pool() -> None:
+    """Ping each idle connection in the sync engine's pool."""
+    engine = get_engine()
+    conns = []
+    try:
+        for _ in range(engine.pool.checkedin()):
+            conns.append(engine.connect())
+        for conn in conns:
+            try:
+                conn.exec_driver_sql("SELECT 1")
+            except Exception as e:
+                logger.warning("Keepalive ping failed, invalidating connection: %s", e)
+                conn.invalidate()
+    finally:
+        for conn in conns:
+            conn.close()
+
+
+async def _ping_async_pool() -> None:
+    """Ping each idle connection in the async engine's pool."""
+    engine = get_async_engine()
+    conns = []
+    try:
+        for _ in range(engine.pool.checkedin()):
+            conns.append(await engine.connect())
+        for conn in conns:
+            try:
+                await conn.exec_driver_sql("SELECT 1")
+            except Exception as e:
+                logger.warning("Keepalive ping failed, invalidating connection: %s", e)
+                await conn.invalidate()
+    finally:
+        for conn in conns:
+            await conn.close()
+
+
+async def _pool_keepalive() -> None:
+    """Periodically ping all idle pooled connections on both engines."""
+    while True:
+        await asyncio.sleep(_KEEPALIVE_INTERVAL_SECONDS)
+        try:
+            await _ping_async_pool()
+        except Exception as e:
+            logger.warning("Async pool keepalive failed: %s", e)
+        try:
+            await asyncio.to_thread(_ping_sync_pool)
+        except Exception as e:
+            logger.warning("Sync pool keepalive failed: %s", e)
+
+
+def start_pool_keepalive() -> None:
+    """Start the background pool keepalive task (called from app lifespan)."""
+    global _keepalive_task
+    if _keepalive_task is None:
+        _keepalive_task = asyncio.create_task(_pool_keepalive())
+
+
+async def stop_pool_keepalive() -> None:
+    """Cancel the pool keepalive task on shutdown."""
+    global _keepalive_task
+    if _keepalive_task is not None:
+        _keepalive_task.cancel()
+        try:
+            await _keepalive_task
+        except asyncio.CancelledError:
+            pass
+        _keepalive_task = None
+
+
 def check_db_connection() -> bool:
     """
     Check if database connection is working.
     Returns True if connection is successful, False otherwise.
+
+    Uses a bare pooled connection and exec_driver_sql - no ORM Session,
+    unit-of-work or statement-compilation overhead for a liveness probe.
     """
     try:
-        db = SessionLocal()
-        db.execute("SELECT 1")
-        db.close()
+        with get_engine().connect() as conn:
+            conn.exec_driver_sql("SELECT 1")
         return True
     except Exception as e:
-        logger.error(f"Database connection check failed: {e}")
+        logger.error("Database connection check failed: %s", e)
         return False
\ No newline at end of file
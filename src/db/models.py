@@ -1,8 +1,13 @@
 """
 Database models for ML/GenAI application.
 """
+import orjson
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, Text, DateTime, Float, Boolean, JSON
+from typing import Iterator, Optional
+from sqlalchemy import Index, Integer, String, Text, DateTime, Boolean, lambda_stmt, select
+from sqlalchemy.dialects.mssql import NVARCHAR
+from sqlalchemy.ext.hybrid import hybrid_property
+from sqlalchemy.orm import Mapped, Session, mapped_column
 from sqlalchemy.sql import func
 
 from src.db.database import Base
@@ -13,19 +18,48 @@ class ModelInfo(Base):
     Sample table - ML model information and metadata.
     """
     __tablename__ = "model_info"
-    
-    id = Column(Integer, primary_key=True, index=True)
-    name = Column(String(255), unique=True, index=True, nullable=False)
-    version = Column(String(50), nullable=False)
-    model_type = Column(String(50), nullable=False)  # 'ml', 'genai', etc.
-    description = Column(Text, nullable=True)
-    file_path = Column(String(500), nullable=True)
-    model_size_mb = Column(Float, nullable=True)
-    accuracy = Column(Float, nullable=True)
-    parameters = Column(JSON, nullable=True)
-    is_active = Column(Boolean, default=True)
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+
+    # Composite index for the common "active models of a type" lookup -
+    # an index seek instead of a table scan. Keep in sync with the manual
+    # DDL in scripts/create_tables.sql (tables are created by script).
+    __table_args__ = (
+        Index("ix_modelinfo_type_active", "model_type", "is_active"),
+    )
+
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    name: Mapped[str] = mapped_column(String(255), unique=True, index=True)
+    version: Mapped[str] = mapped_column(String(50))
+    model_type: Mapped[str] = mapped_column(String(50))  # 'ml', 'genai', etc.
+    description: Mapped[Optional[str]] = mapped_column(Text)
+    file_path: Mapped[Optional[str]] = mapped_column(String(500))
+    model_size_mb: Mapped[Optional[float]]
+    accuracy: Mapped[Optional[float]]
+    # Raw NVARCHAR(MAX) instead of a JSON column type: skips the per-row
+    # decode on every fetch. Decode lazily via the `parameters` hybrid
+    # below, or project single fields server-side with
+    # func.JSON_VALUE(ModelInfo.parameters, '$.field').
+    parameters_json: Mapped[Optional[str]] = mapped_column("parameters", NVARCHAR(None))
+    is_active: Mapped[bool] = mapped_column(Boolean, default=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
+    updated_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), onupdate=func.now())
+
+    @hybrid_property
+    def parameters(self):
+        """Decode the parameters JSON blob on demand (orjson's C parser)."""
+        if self.parameters_json is None:
+            return None
+        return orjson.loads(self.parameters_json)
+
+    @parameters.setter
+    def parameters(self, value) -> None:
+        self.parameters_json = None if value is None else orjson.dumps(value).decode()
+
+    @parameters.expression
+    def parameters(cls):
+        # Class-level access maps to the raw column so queries can wrap it
+        # in SQL Server JSON functions (JSON_VALUE/JSON_QUERY)
+        return cls.parameters_json
 
 
 class Worker(Base):
@@ -33,13 +67,45 @@ class Worker(Base):
     Worker table - Employee information.
     """
     __tablename__ = "Worker"
-    
-    WORKER_ID = Column(Integer, primary_key=True, index=True, autoincrement=True)
-    FIRST_NAME = Column(String(255), nullable=False)
-    LAST_NAME = Column(String(255), nullable=False)
-    SALARY = Column(Integer, nullable=False)
-    JOINING_DATE = Column(DateTime, nullable=False)
-    DEPARTMENT = Column(String(255), nullable=False)
+
+    # Composite index for department-filtered salary queries/aggregates.
+    # Keep in sync with the manual DDL in scripts/create_tables.sql.
+    __table_args__ = (
+        Index("ix_worker_dept_salary", "DEPARTMENT", "SALARY"),
+    )
+
+
+    WORKER_ID: Mapped[int] = mapped_column(Integer, primary_key=True, index=True, autoincrement=True)
+    FIRST_NAME: Mapped[str] = mapped_column(String(255))
+    LAST_NAME: Mapped[str] = mapped_column(String(255))
+    SALARY: Mapped[int]
+    JOINING_DATE: Mapped[datetime] = mapped_column(DateTime)
+    DEPARTMENT: Mapped[str] = mapped_column(String(255))
+
+
+def select_active_models(db: Session, model_type: str = None):
+    """
+    Look up active ModelInfo rows, optionally filtered by type.
+
+    Built with lambda_stmt so the Core statement construction and
+    compilation are memoized on the lambda's identity - hot callers skip
+    ORM statement building entirely after the first execution.
+    """
+    stmt = lambda_stmt(lambda: select(ModelInfo).where(ModelInfo.is_active == True))  # noqa: E712
+    if model_type is not None:
+        stmt += lambda s: s.where(ModelInfo.model_type == model_type)
+    return db.execute(stmt).scalars()
+
+
+def stream_workers(db: Session, batch_size: int = 1000) -> Iterator[Worker]:
+    """
+    Stream Worker rows in fixed-size batches for bulk reads (analytics,
+    exports). yield_per bounds peak memory at batch_size rows regardless of
+    table size, instead of materializing the full result list.
+    """
+    return db.execute(
+        select(Worker).execution_options(yield_per=batch_size)
+    ).scalars()
 
 
 # TODO: Add more tables as needed:
@@ -2,19 +2,41 @@
 Tests for health check endpoints.
 """
 import pytest
-from fastapi.testclient import TestClient
-from unittest.mock import patch, MagicMock
+import pytest_asyncio
+from httpx import ASGITransport, AsyncClient
+from unittest.mock import MagicMock
 
 from main import app
+from src.api.routers import health
+from src.db.database import get_db
 
-client = TestClient(app)
+pytestmark = pytest.mark.asyncio(loop_scope="session")
 
 
-def test_basic_health_check():
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def client():
+    """Session-scoped ASGI client - built once instead of per test, and
+    requests go straight to the app without the sync-to-async bridge."""
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://testserver") as c:
+        yield c
+
+
+@pytest.fixture(autouse=True)
+def _reset_health_state():
+    """Expire the TTL-cached DB probe and drop dependency overrides so
+    tests don't observe each other's database state."""
+    health._db_probe_cache["expires"] = 0.0
+    health._db_probe_cache["component"] = None
+    yield
+    app.dependency_overrides.pop(get_db, None)
+
+
+async def test_basic_health_check(client):
     """Test basic health check endpoint."""
-    response = client.get("/api/v1/health")
+    response = await client.get("/api/v1/health")
     assert response.status_code == 200
-    
+
     data = response.json()
     assert data["status"] == "healthy"
     assert "timestamp" in data
@@ -23,17 +45,16 @@ def test_basic_health_check():
     assert "app_name" in data
 
 
-@patch('src.api.routers.health.get_db')
-def test_detailed_health_check_with_db_success(mock_get_db):
+async def test_detailed_health_check_with_db_success(client):
     """Test detailed health check with successful database connection."""
     # Mock database session
     mock_db = MagicMock()
     mock_db.execute.return_value.fetchone.return_value = [1]
-    mock_get_db.return_value = mock_db
-    
-    response = client.get("/api/v1/health/detailed")
+    app.dependency_overrides[get_db] = lambda: mock_db
+
+    response = await client.get("/api/v1/health/detailed")
     assert response.status_code == 200
-    
+
     data = response.json()
     assert data["status"] == "healthy"
     assert "components" in data
@@ -41,17 +62,16 @@ def test_detailed_health_check_with_db_success(mock_get_db):
     assert data["components"]["database"]["status"] == "healthy"
 
 
-@patch('src.api.routers.health.get_db')
-def test_detailed_health_check_with_db_failure(mock_get_db):
+async def test_detailed_health_check_with_db_failure(client):
     """Test detailed health check with database connection failure."""
     # Mock database session with exception
     mock_db = MagicMock()
     mock_db.execute.side_effect = Exception("Database connection failed")
-    mock_get_db.return_value = mock_db
-    
-    response = client.get("/api/v1/health/detailed")
+    app.dependency_overrides[get_db] = lambda: mock_db
+
+    response = await client.get("/api/v1/health/detailed")
     assert response.status_code == 200
-    
+
     data = response.json()
     assert data["status"] == "degraded"
     assert "components" in data
@@ -59,21 +79,21 @@ def test_detailed_health_check_with_db_failure(mock_get_db):
     assert data["components"]["database"]["status"] == "unhealthy"
 
 
-def test_readiness_check():
+async def test_readiness_check(client):
     """Test readiness check endpoint."""
-    response = client.get("/api/v1/health/ready")
+    response = await client.get("/api/v1/health/ready")
     assert response.status_code == 200
-    
+
     data = response.json()
     assert data["status"] == "ready"
     assert "timestamp" in data
 
 
-def test_liveness_check():
+async def test_liveness_check(client):
     """Test liveness check endpoint."""
-    response = client.get("/api/v1/health/live")
+    response = await client.get("/api/v1/health/live")
     assert response.status_code == 200
-    
+
     data = response.json()
     assert data["status"] == "alive"
-    assert "timestamp" in data
\ No newline at end of file
+    assert "timestamp" in data